@@ -1,63 +1,309 @@
 import os
+import re
+import ntpath
 import zipfile
-import rarfile
-import py7zr
+import zlib
 import shutil
+import subprocess
 import tempfile
+import threading
+import functools
+import contextlib
+import importlib
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 import argparse
+import atexit
+
+# Optional faster DEFLATE/CRC32 backends (same format as zlib, SIMD-accelerated).
+# zipfile looks these up at call time, so swapping the module is enough.
+try:
+    from isal import isal_zlib as fast_zlib
+except ImportError:
+    try:
+        from zlib_ng import zlib_ng as fast_zlib
+    except ImportError:
+        fast_zlib = None
+
+if fast_zlib is not None:
+    zipfile.zlib = fast_zlib
+    zipfile.crc32 = fast_zlib.crc32
 
 # -------------------------
 # Configuration
 # -------------------------
 DAZ_FOLDERS = ["data", "People", "Props", "Runtime", "Environments", "Scenes"]
+DAZ_FOLDERS_LOWER = frozenset(f.lower() for f in DAZ_FOLDERS)
 PROMO_EXTS = {".jpg", ".jpeg", ".png", ".gif", ".pdf", ".txt", ".doc", ".docx", ".rtf"}
 ARCHIVE_EXTS = {".zip", ".rar", ".7z"} 
 
+def _ext_pattern(exts) -> re.Pattern:
+    """Compile a case-insensitive "file name ends in one of `exts`" matcher."""
+    alternatives = "|".join(re.escape(e.lstrip(".")) for e in sorted(exts))
+    # Starting with a literal "." lets search() skip straight to the dots
+    return re.compile(rf"\.(?:{alternatives})\Z", re.IGNORECASE)
+
+# Per-file extension checks run on every extracted file and archive member
+_PROMO_RE = _ext_pattern(PROMO_EXTS)
+_ARCHIVE_RE = _ext_pattern(ARCHIVE_EXTS)
+
+ARCHIVE_MAGIC = (
+    (b"PK\x03\x04", ".zip"),
+    (b"PK\x05\x06", ".zip"),  # empty zip
+    (b"PK\x07\x08", ".zip"),  # spanned zip marker
+    (b"Rar!\x1a\x07", ".rar"),  # RAR 4 and 5
+    (b"7z\xbc\xaf\x27\x1c", ".7z"),
+)
+WORK_DIR_PREFIX = ".dazwork-"
+COPY_BUFSIZE = 4 * 1024 * 1024  # read/write chunk for copies that can't stay in the kernel
+MAX_EXTRACT_THREADS = 8  # caps open archives per worker when extracting nested archives
+SPOOL_MAX_SIZE = 16 * 1024 * 1024  # compressed files larger than this spill to disk in parallel_zip
+NATIVE_EXTRACT_THRESHOLD = 200 * 1024 * 1024  # bytes; smaller archives stay with py7zr/rarfile
+PIPELINE_DEPTH = 2  # archives submitted beyond the worker count, to keep workers busy during merges
+
+# Serializes merging extracted nested archives into their shared parent folder
+_nested_merge_lock = threading.Lock()
+
+# Background deletion of finished temp dirs (drained at interpreter exit)
+_cleanup_pool = ThreadPoolExecutor(max_workers=1)
+
+# Archive libraries are imported lazily; py7zr alone pulls in a lot of modules
+ARCHIVE_MODULES = {".rar": "rarfile", ".7z": "py7zr"}
+
+def _init_worker(preload_exts=()):
+    """
+    Process pool initializer: import the archive libraries the input
+    archives will need once per worker instead of on first use.
+    """
+    for ext in preload_exts:
+        if ext in ARCHIVE_MODULES:
+            try:
+                importlib.import_module(ARCHIVE_MODULES[ext])
+            except ImportError:
+                pass  # reported per archive by extract_archive
+
+# -------------------------
+# Filesystem Helpers
+# -------------------------
+def _ext(name: str) -> str:
+    """
+    Lower-cased extension of a file name, like Path.suffix but without
+    building a Path.
+    """
+    i = name.rfind(".")
+    return name[i:].lower() if i > 0 else ""
+
+def _has_ext(pattern: re.Pattern, name: str) -> bool:
+    """
+    True if file name `name` ends in an extension matched by `pattern`.
+    Like Path.suffix, a bare ".jpg" has no extension.
+    """
+    match = pattern.search(name)
+    return match is not None and match.start() > 0
+
+def _fast_copy2(src, dst):
+    """
+    shutil.copy2 replacement that copies with os.copy_file_range on Linux
+    (in-kernel, and a reflink on btrfs/XFS). Elsewhere shutil.copy2 already
+    uses the native fast path (fcopyfile, CopyFile2), so it is used as is.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(src, dst)
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        offset = 0
+        try:
+            while True:
+                sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+                if not sent:
+                    break
+                offset += sent
+        except OSError:
+            # Unsupported here (old kernel, some filesystems, ...)
+            offset = 0
+    # Like CPython's own copy_file_range path, a 0 on the first call is not
+    # trusted as EOF: procfs/sysfs and some FUSE/NFS mounts return it for
+    # files that aren't empty. Empty files just take the slow path.
+    if not offset:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+def _scandir_recursive(root):
+    """
+    Yield an os.DirEntry for every file and directory under `root`.
+    Uses the cached DirEntry metadata instead of stat()-ing each path.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    yield entry
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except (PermissionError, FileNotFoundError):
+            pass
+
 # -------------------------
 # Archive Extraction Helpers
 # -------------------------
-def extract_archive(archive_path: Path, dest_dir: Path):
-    """Extract a zip, rar, or 7z archive into dest_dir."""
+def _archive_format(archive_path: Path) -> str | None:
+    """
+    Detect an archive's real format from its magic bytes, as the matching
+    extension (".zip", ".rar", ".7z"), so misnamed files open with the right
+    library. Files whose leading bytes match nothing (e.g. self-extracting
+    zips, which start with a stub) go by their suffix instead.
+    Returns None for anything else.
+    """
+    try:
+        with open(archive_path, "rb") as f:
+            ext = _format_from_magic(f.read(8))
+    except OSError:
+        return None
+    if ext is None:
+        ext = _ext(archive_path.name)
+        if ext not in ARCHIVE_EXTS:
+            return None
+    return ext
+
+def _format_from_magic(head: bytes) -> str | None:
+    """Archive extension matching the leading bytes `head`, or None."""
+    for magic, ext in ARCHIVE_MAGIC:
+        if head.startswith(magic):
+            return ext
+    return None
+
+def _native_extractor(archive_path: Path, ext: str | None) -> str | None:
+    """
+    Path of a native 7z/unrar binary to use for `archive_path`, or None.
+    Only archives of at least NATIVE_EXTRACT_THRESHOLD bytes qualify; below
+    that, process startup costs more than py7zr/rarfile lose.
+    """
     try:
-        ext = archive_path.suffix.lower()
+        if archive_path.stat().st_size < NATIVE_EXTRACT_THRESHOLD:
+            return None
+    except OSError:
+        return None
+    if ext == ".7z":
+        return shutil.which("7z") or shutil.which("7zz") or shutil.which("7za")
+    if ext == ".rar":
+        return shutil.which("unrar")
+    return None
+
+def extract_archive(archive_path: Path, dest_dir: Path, include_promos: bool = True, native_extractors: bool = False) -> bool:
+    """
+    Extract a zip, rar, or 7z archive into dest_dir. Returns True on success.
+    Unless include_promos is set, promo files that copy_daz_root would
+    skip anyway are left compressed inside the archive.
+    With native_extractors, large 7z/rar archives are handed to the 7z/unrar
+    binaries, which decompress on several cores (py7zr is single-threaded).
+    If the binary fails, the archive is extracted with py7zr/rarfile instead.
+    """
+    try:
+        ext = _archive_format(archive_path)
+        exe = _native_extractor(archive_path, ext) if native_extractors else None
+        if exe:
+            if ext == ".7z":
+                cmd = [exe, "x", "-y", "-mmt=on", f"-o{dest_dir}", str(archive_path)]
+            else:
+                # unrar already uses all cores by default (and caps -mt at 64)
+                cmd = [exe, "x", "-y", "-idq", str(archive_path), f"{dest_dir}{os.sep}"]
+            try:
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+                return True
+            except (subprocess.CalledProcessError, OSError) as e:
+                print(f"⚠️ {Path(exe).name} failed on {archive_path.name} ({e}), retrying with the Python extractor")
         if ext == ".zip":
             with zipfile.ZipFile(archive_path, 'r') as z:
-                z.extractall(dest_dir)
+                z.extractall(dest_dir, members=_members_without_promos(z.namelist(), include_promos))
         elif ext == ".rar":
+            import rarfile
             with rarfile.RarFile(archive_path, 'r') as r:
-                r.extractall(dest_dir)
+                r.extractall(dest_dir, members=_members_without_promos(r.namelist(), include_promos))
         elif ext == ".7z":
+            import py7zr
             with py7zr.SevenZipFile(archive_path, 'r') as z:
-                z.extractall(dest_dir)
+                z.extract(dest_dir, targets=_members_without_promos(z.getnames(), include_promos))
         else:
             print(f"⚠️ Skipping unsupported archive: {archive_path}")
-            return
+            return False
     except Exception as e:
         print(f"❌ Failed to extract {archive_path}: {e}")
+        return False
+    return True
 
-def extract_all_archives_recursively(root: Path):
+def _extract_nested_archive(archive: Path, include_promos: bool = True, native_extractors: bool = False) -> bool:
+    """
+    Extract a nested archive next to itself, then delete it.
+    Sibling archives extract at the same time and often share folders
+    (data/, Runtime/Textures/, ...), which makes zipfile's makedirs calls
+    race. So each archive extracts into its own staging folder, which is
+    then merged into place under a lock (renames only, so that's quick).
+    The archive is kept if extraction fails; returns whether it succeeded.
+    """
+    staging = None
+    try:
+        extract_to = archive.parent
+        print(f"📦 Extracting nested archive: {archive}")
+        staging = Path(tempfile.mkdtemp(dir=extract_to, prefix=".dazextract-"))
+        if not extract_archive(archive, staging, include_promos, native_extractors):
+            return False
+        with _nested_merge_lock:
+            for item in staging.iterdir():
+                _move_tree(item, extract_to / item.name, same_fs=True)
+        archive.unlink(missing_ok=True)
+        return True
+    except Exception as e:
+        print(f"⚠️ Failed to extract nested archive {archive}: {e}")
+        return False
+    finally:
+        if staging is not None:
+            shutil.rmtree(staging, ignore_errors=True)
+
+def _outermost_dirs(dirs) -> list[Path]:
+    """Drop directories that lie inside another directory of `dirs`."""
+    kept = []
+    for d in sorted(set(dirs), key=lambda p: len(p.parts)):
+        if not any(d.is_relative_to(k) for k in kept):
+            kept.append(d)
+    return kept
+
+def extract_all_archives_recursively(root: Path, include_promos: bool = True, native_extractors: bool = False):
     """
     Recursively extract all supported archives under `root`, case-insensitively.
-    Continues until no archives remain.
+    Continues until no archives remain. After the first pass only the folders
+    that just received extracted content are scanned again.
     """
     iteration = 0
+    pending = [root]
+    failed = set()  # left in place, but not retried on later passes
     while True:
-        archives = [p for p in root.rglob("*") if p.suffix.lower() in ARCHIVE_EXTS]
+        archives = [
+            Path(e.path) for d in pending for e in _scandir_recursive(d)
+            if e.is_file(follow_symlinks=False) and _has_ext(_ARCHIVE_RE, e.name)
+            and e.path not in failed
+        ]
         if not archives:
             print(f"🔍 No more archives found after {iteration} passes.\n")
             break
 
         print(f"🔍 Pass {iteration}: Found {len(archives)} archives to extract.")
-        for archive in archives:
-            try:
-                extract_to = archive.parent
-                print(f"📦 Extracting nested archive: {archive}")
-                extract_archive(archive, extract_to)
-                archive.unlink(missing_ok=True)
-            except Exception as e:
-                print(f"⚠️ Failed to extract nested archive {archive}: {e}")
-
+        # Decompression releases the GIL, so sibling archives extract in parallel
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, MAX_EXTRACT_THREADS)) as executor:
+            extract_one = functools.partial(
+                _extract_nested_archive,
+                include_promos=include_promos,
+                native_extractors=native_extractors
+            )
+            for archive, ok in zip(archives, executor.map(extract_one, archives)):
+                if not ok:
+                    failed.add(str(archive))
+
+        # Archives extract next to themselves, so only their folders can hold new ones
+        pending = _outermost_dirs(a.parent for a in archives)
         iteration += 1
 
 # -------------------------
@@ -68,158 +314,430 @@ def find_daz_root(root: Path) -> Path | None:
     Detects the DAZ Studio content root in `root`.
     Works for cases where DAZ folders (Runtime, People, Data, etc.)
     are directly in `root` or nested multiple levels deep.
+    Searches breadth-first, so the shallowest match wins and the walk
+    stops at the first directory that directly contains DAZ folders.
     """
-    daz_folders = set(f.lower() for f in DAZ_FOLDERS)
-
-    # --- Case 1: Root itself already contains DAZ folders
-    top_level = {p.name.lower() for p in root.iterdir() if p.is_dir()}
-    if daz_folders.intersection(top_level):
-        return root
-
-    # --- Case 2: Search deeper for nested content
-    for path in root.rglob("*"):
-        if not path.is_dir():
+    queue = deque([root])
+    while queue:
+        current = queue.popleft()
+        subdirs = []
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    if entry.name.lower() in DAZ_FOLDERS_LOWER:
+                        # Return this directory (the one that directly contains DAZ folders)
+                        return Path(current)
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+        except (PermissionError, FileNotFoundError):
             continue
-        subdirs = {p.name.lower() for p in path.iterdir() if p.is_dir()}
-        if daz_folders.intersection(subdirs):
-            # Return this directory (the one that directly contains DAZ folders)
-            return path
+
+        queue.extend(subdirs)
 
     return None
 
+def find_daz_prefix(names: list[str]) -> tuple[str, ...] | None:
+    """
+    Same as find_daz_root, but for an archive listing instead of a folder.
+    Returns the path parts of the shallowest folder that directly contains
+    DAZ folders (an empty tuple for the archive root), or None.
+    """
+    best = None
+    for name in names:
+        # Only directory segments count, never the member's own file name
+        dirs = _split_member_name(name)
+        if not name.endswith("/"):
+            dirs = dirs[:-1]
+        for depth, part in enumerate(dirs):
+            if best is not None and depth >= len(best):
+                break
+            if part.lower() in DAZ_FOLDERS_LOWER:
+                best = tuple(dirs[:depth])
+                break
+    return best
 
+# -------------------------
+# Selective Extraction
+# -------------------------
+# Characters zipfile replaces with "_" when extracting on Windows
+_WINDOWS_ILLEGAL = str.maketrans(':<>|"?*', "_______")
+
+def _split_member_name(name: str) -> list[str]:
+    """
+    Path parts of archive member `name`, cleaned up the way zipfile does
+    before extracting: any drive or UNC share is stripped and "", "." and
+    ".." parts are dropped, so the result can't escape the destination.
+    """
+    name = ntpath.splitdrive(name.replace("\\", "/"))[1]
+    return [p for p in name.split("/") if p not in ("", ".", "..")]
+
+def _member_parts(name: str, prefix: tuple[str, ...]) -> list[str] | None:
+    """
+    Path parts of archive member `name` below `prefix`, or None if outside it.
+    On Windows, characters illegal in file names are replaced like zipfile's
+    extractall does (e.g. "Ref: v2" becomes "Ref_ v2").
+    """
+    parts = _split_member_name(name)
+    if parts[:len(prefix)] != list(prefix):
+        return None
+    parts = parts[len(prefix):]
+    if os.sep == "\\":
+        parts = [p.translate(_WINDOWS_ILLEGAL).rstrip(".") for p in parts]
+        parts = [p for p in parts if p]
+    return parts or None
+
+def _has_nested_archives(names: list[str]) -> bool:
+    """True if an archive listing contains further archives."""
+    return any(_is_archive_name(n) for n in names)
+
+def _members_without_promos(names: list[str], include_promos: bool) -> list[str] | None:
+    """
+    Members of a self-contained archive minus the promo files sitting at the
+    top of its DAZ root, i.e. exactly what copy_daz_root would drop.
+    Returns None (extract everything) when that can't be decided from the
+    listing alone, e.g. because nested archives may still move the root.
+    """
+    if include_promos or _has_nested_archives(names):
+        return None
+    prefix = find_daz_prefix(names)
+    if prefix is None:
+        return None
+    kept = []
+    for name in names:
+        parts = _member_parts(name, prefix)
+        if parts and _has_ext(_PROMO_RE, parts[0]):
+            continue
+        kept.append(name)
+    return kept if len(kept) < len(names) else None
+
+def _is_archive_name(name: str) -> bool:
+    """True if archive member `name` is itself an archive."""
+    return _has_ext(_ARCHIVE_RE, name.rstrip("/").rpartition("/")[2])
+
+def _open_nested_zip(archive, name: str, scratch_dir: Path, stack: contextlib.ExitStack):
+    """
+    Open nested archive member `name` as a ZipFile, so its members can be
+    streamed out like those of the outer archive. Only the compressed blob
+    is written out (to an anonymous file in scratch_dir), never its contents.
+    Returns None if the member is not a self-contained zip.
+    """
+    blob = stack.enter_context(tempfile.TemporaryFile(dir=scratch_dir))
+    with archive.open(name) as src:
+        shutil.copyfileobj(src, blob, COPY_BUFSIZE)
+    blob.seek(0)
+    if _format_from_magic(blob.read(8)) != ".zip":
+        return None
+    blob.seek(0)
+    inner = stack.enter_context(zipfile.ZipFile(blob))
+    if _has_nested_archives(inner.namelist()):
+        return None
+    return inner
+
+def extract_daz_members(archive_path: Path, dest_dir: Path, include_promos: bool, scratch_dir: Path | None = None) -> bool:
+    """
+    Extract only the DAZ content of `archive_path` into dest_dir, without
+    the folders above the DAZ root. The root is located from the archive
+    listing, so nothing outside it is ever decompressed.
+    Nested zips (one level deep, zip/rar outer archives only) are read in
+    place as if they had been extracted next to themselves; their blobs are
+    spilled to scratch_dir, so pass one to enable this.
+    Returns False when the archive needs the full extraction pass: deeper
+    or non-zip nesting, no DAZ root, an unreadable listing, or a member that
+    failed to extract (whatever was written by then is overwritten by the
+    full pass).
+    """
+    ext = _archive_format(archive_path)
+    try:
+        if ext == ".zip":
+            archive = zipfile.ZipFile(archive_path, 'r')
+        elif ext == ".rar":
+            import rarfile
+            archive = rarfile.RarFile(archive_path, 'r')
+        elif ext == ".7z":
+            import py7zr
+            archive = py7zr.SevenZipFile(archive_path, 'r')
+        else:
+            return False
+    except Exception:
+        return False
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(archive)
+        names = archive.getnames() if ext == ".7z" else archive.namelist()
+
+        # (source archive, member name, path as it would be after full extraction)
+        members = [(archive, n, n) for n in names if not _is_archive_name(n)]
+        nested = [n for n in names if _is_archive_name(n)]
+        if nested and (ext == ".7z" or scratch_dir is None):
+            return False
+        try:
+            for name in nested:
+                inner = _open_nested_zip(archive, name, scratch_dir, stack)
+                if inner is None:
+                    return False
+                # Nested archives extract into their own folder
+                parent = name.replace("\\", "/").rpartition("/")[0]
+                members.extend((inner, n, f"{parent}/{n}" if parent else n) for n in inner.namelist())
+        except Exception:
+            return False
+
+        prefix = find_daz_prefix([virtual for _, _, virtual in members])
+        if prefix is None:
+            return False
+
+        # Same promo rule as copy_daz_root: only top-level items are filtered
+        selected = []
+        for source, name, virtual in members:
+            parts = _member_parts(virtual, prefix)
+            if not parts:
+                continue
+            if not include_promos and _has_ext(_PROMO_RE, parts[0]):
+                continue
+            selected.append((source, name, parts))
+
+        print(f"🧭 Found DAZ root in archive at: /{'/'.join(prefix)}")
+        try:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            if ext == ".7z":
+                # py7zr can't rename members, so extract next to dest_dir and move up
+                scratch = Path(tempfile.mkdtemp(dir=dest_dir, prefix=".dazextract-"))
+                try:
+                    archive.extract(path=scratch, targets=[name for _, name, _ in selected])
+                    for item in scratch.joinpath(*prefix).iterdir():
+                        _move_tree(item, dest_dir / item.name, same_fs=True)
+                finally:
+                    shutil.rmtree(scratch, ignore_errors=True)
+            else:
+                for source, name, parts in selected:
+                    target = dest_dir.joinpath(*parts)
+                    info = source.getinfo(name)
+                    if info.is_dir():
+                        target.mkdir(parents=True, exist_ok=True)
+                        continue
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    with source.open(info) as src, open(target, "wb") as dst:
+                        shutil.copyfileobj(src, dst, COPY_BUFSIZE)
+        except Exception as e:
+            print(f"⚠️ Selective extraction of {archive_path.name} failed ({e}), extracting it in full")
+            return False
+    return True
 
 # -------------------------
 # Copy + Normalize
 # -------------------------
-def copy_daz_root(source_root: Path, output_dir: Path, include_promos: bool):
-    """Copy the DAZ content from source_root to output_dir."""
+def _move_tree(src: Path, dest: Path, same_fs: bool):
+    """
+    Move `src` (file or directory) to `dest`, merging into existing folders.
+    Uses O(1) renames when both sides are on the same filesystem and
+    falls back to copying otherwise.
+    """
+    if src.is_dir():
+        if same_fs and not dest.exists():
+            os.rename(src, dest)
+            return
+        dest.mkdir(exist_ok=True)
+        with os.scandir(src) as it:
+            for entry in it:
+                _move_tree(Path(entry.path), dest / entry.name, same_fs)
+        return
+
+    if same_fs:
+        try:
+            os.replace(src, dest)
+            return
+        except OSError:
+            pass
+    _fast_copy2(src, dest)
+
+def copy_daz_root(source_root: Path, output_dir: Path, include_promos: bool, move: bool = False):
+    """
+    Copy the DAZ content from source_root to output_dir.
+    With `move`, files are renamed into place instead of copied, which
+    empties source_root; only use it on throwaway temp directories.
+    """
+    same_fs = move and os.stat(source_root).st_dev == os.stat(output_dir).st_dev
     for item in source_root.iterdir():
-        if not include_promos and item.suffix.lower() in PROMO_EXTS:
+        if not include_promos and _has_ext(_PROMO_RE, item.name):
             continue
         dest = output_dir / item.name
-        if item.is_dir():
-            shutil.copytree(item, dest, dirs_exist_ok=True)
+        if move:
+            _move_tree(item, dest, same_fs)
+        elif item.is_dir():
+            shutil.copytree(item, dest, dirs_exist_ok=True, copy_function=_fast_copy2)
         else:
-            shutil.copy2(item, dest)
+            _fast_copy2(item, dest)
+
+def make_zip_stored(src_dir: Path, zip_path: Path) -> Path:
+    """
+    Zip the contents of src_dir into zip_path without recompressing them.
+    DAZ content is mostly textures and already-compressed .duf/.dsf files,
+    so deflating it again burns CPU for next to no size gain.
+    """
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+        for entry in _scandir_recursive(src_dir):
+            zf.write(entry.path, arcname=os.path.relpath(entry.path, src_dir))
+    return zip_path
+
+def _deflate_file(path: str, spool_dir: Path) -> tuple[int, int, tempfile.SpooledTemporaryFile]:
+    """
+    Raw-DEFLATE one file for parallel_zip. Returns (crc32, size, compressed),
+    with the compressed bytes in a spooled buffer rewound to the start.
+    """
+    zlib_impl = fast_zlib or zlib
+    compressor = zlib_impl.compressobj(zlib_impl.Z_DEFAULT_COMPRESSION, zlib_impl.DEFLATED, -15)
+    crc = size = 0
+    compressed = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, dir=spool_dir)
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_BUFSIZE):
+            crc = zlib_impl.crc32(chunk, crc)
+            size += len(chunk)
+            compressed.write(compressor.compress(chunk))
+    compressed.write(compressor.flush())
+    compressed.seek(0)
+    return crc, size, compressed
+
+def parallel_zip(src_dir: Path, zip_path: Path, workers: int | None = None) -> Path:
+    """
+    Zip the contents of src_dir into zip_path with DEFLATE, compressing
+    files on a thread pool. Entries are independent, so each worker deflates
+    whole files and this thread appends the finished streams in order.
+    """
+    workers = workers or os.cpu_count() or 1
+    window = deque()  # (arcname, path, future or None for folders), in archive order
+
+    with zipfile.ZipFile(zip_path, 'w', allowZip64=True) as zf, ThreadPoolExecutor(max_workers=workers) as executor:
+        def write_next():
+            arcname, path, future = window.popleft()
+            if future is None:
+                zf.write(path, arcname=arcname)
+                return
+            crc, size, compressed = future.result()
+            with compressed:
+                zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                zinfo.CRC = crc
+                zinfo.file_size = size
+                zinfo.compress_size = compressed.seek(0, os.SEEK_END)
+                compressed.seek(0)
+                # zipfile has no API for pre-compressed data: write the local
+                # header + stream ourselves and let close() emit the central directory
+                zinfo.header_offset = zf.fp.tell()
+                zf.fp.write(zinfo.FileHeader())
+                shutil.copyfileobj(compressed, zf.fp, COPY_BUFSIZE)
+                zf.filelist.append(zinfo)
+                zf.NameToInfo[zinfo.filename] = zinfo
+                zf.start_dir = zf.fp.tell()
+
+        for entry in _scandir_recursive(src_dir):
+            arcname = os.path.relpath(entry.path, src_dir)
+            if entry.is_dir():
+                window.append((arcname, entry.path, None))
+            else:
+                window.append((arcname, entry.path, executor.submit(_deflate_file, entry.path, zip_path.parent)))
+            # Bound how many compressed files wait in memory/spool files
+            if len(window) > 2 * workers:
+                write_next()
+        while window:
+            write_next()
+    return zip_path
 
 # -------------------------
 # Main Processing Logic
 # -------------------------
-def process_archive(archive_path: Path, output_dir: Path, include_promos: bool, keep_temp: bool, merge_into_content: bool):
-    tempdir = Path(tempfile.mkdtemp())
+def remove_work_dir(tempdir: Path):
+    """
+    Delete a temp work dir without blocking the caller: rename it aside
+    (instant), then rmtree it on the background cleanup thread.
+    """
+    trash = tempdir.with_name(tempdir.name + ".trash")
+    try:
+        os.rename(tempdir, trash)
+    except OSError:
+        trash = tempdir
+    _cleanup_pool.submit(shutil.rmtree, trash, ignore_errors=True)
+
+def stage_archive(archive_path: Path, output_dir: Path, include_promos: bool, keep_temp: bool, merge_into_content: bool, temp_root: Path | None = None, native_extractors: bool = False) -> tuple[Path, Path] | None:
+    """
+    Pipeline stage 1 (runs in the worker pool): extract `archive_path` and
+    locate its DAZ root. Returns (tempdir, daz_root) for finish_archive, or
+    None when there is nothing to finish.
+    """
+    # Work next to the output so moving results into place is a rename, not a copy
+    tempdir = Path(tempfile.mkdtemp(dir=temp_root or output_dir, prefix=WORK_DIR_PREFIX))
+    cleaned_dir = output_dir / (archive_path.stem + "_normalized")
     print(f"\n📦 Processing {archive_path.name}...")
-    extract_archive(archive_path, tempdir)
-    print(f"📂 Contents after first extraction: {[p.name for p in tempdir.iterdir()]}")
-    extract_all_archives_recursively(tempdir)
 
-    daz_root = find_daz_root(tempdir)
-    if daz_root:
-        print(f"🧭 Found DAZ root at: {daz_root}")
+    # Fast path: flat archives go straight to their final folder. Merges are
+    # staged in tempdir, since only finish_archive may write to Content.
+    # Archives big enough for a native extractor skip it: reading members one
+    # by one through py7zr/rarfile is what the native binaries are faster at.
+    direct_dir = tempdir if merge_into_content else cleaned_dir
+    native = native_extractors and _native_extractor(archive_path, _archive_format(archive_path))
+    if not native and extract_daz_members(archive_path, direct_dir, include_promos, scratch_dir=tempdir):
+        daz_root = direct_dir
     else:
-        print("🧭 No DAZ root detected.")
+        extract_archive(archive_path, tempdir, include_promos, native_extractors)
+        print(f"📂 Contents after first extraction: {[p.name for p in tempdir.iterdir()]}")
+        extract_all_archives_recursively(tempdir, include_promos, native_extractors)
+
+        daz_root = find_daz_root(tempdir)
+
+        if daz_root:
+            print(f"🧭 Found DAZ root at: {daz_root}")
+        else:
+            print("🧭 No DAZ root detected.")
 
     if not daz_root:
         print(f"⚠️ No DAZ folder found in {archive_path.name}")
         if keep_temp:
             print(f"🧭 Keeping temp dir for inspection: {tempdir}")
         else:
-            shutil.rmtree(tempdir, ignore_errors=True)
-        return
-
-    if merge_into_content:
-        content_dir = output_dir / "Content"
-        content_dir.mkdir(parents=True, exist_ok=True)
-        copy_daz_root(daz_root, content_dir, include_promos)
-        print(f"✅ Merged {archive_path.name} → {content_dir}")
-    else:
-        cleaned_dir = output_dir / (archive_path.stem + "_normalized")
-        cleaned_dir.mkdir(parents=True, exist_ok=True)
-        copy_daz_root(daz_root, cleaned_dir, include_promos)
-        zip_path = shutil.make_archive(str(cleaned_dir), "zip", cleaned_dir)
-        print(f"✅ Normalized: {archive_path.name} → {Path(zip_path).name}")
+            remove_work_dir(tempdir)
+        return None
 
-    if not keep_temp:
-        shutil.rmtree(tempdir, ignore_errors=True)
-
-    tempdir = Path(tempfile.mkdtemp())
-
-    print(f"📦 Extracting {archive_path.name}...")
-    extract_archive(archive_path, tempdir)
-    extract_all_archives_recursively(tempdir)
-
-    daz_root = find_daz_root(tempdir)
-
-    # If still nothing found, walk all subfolders as last resort
-    if not daz_root:
-        for sub in tempdir.rglob("*"):
-            if sub.is_dir():
-                daz_root = find_daz_root(sub)
-                if daz_root:
-                    break
-
-    if not daz_root:
-        print(f"⚠️ No DAZ folder found in {archive_path.name}")
-        if not keep_temp:
-            shutil.rmtree(tempdir, ignore_errors=True)
-        return
+    return tempdir, daz_root
 
+def finish_archive(archive_path: Path, tempdir: Path, daz_root: Path, output_dir: Path, include_promos: bool, keep_temp: bool, merge_into_content: bool, compress: bool = False, zip_workers: int | None = None):
+    """
+    Pipeline stage 2: move the DAZ content found by stage_archive into place,
+    zip it if needed, and clean up. Per-archive zips are finished in the
+    worker that staged them, with zip_workers deflate threads; merges into
+    Content run only on the main process's single consumer thread, so they
+    never overlap.
+    """
+    cleaned_dir = output_dir / (archive_path.stem + "_normalized")
     if merge_into_content:
         content_dir = output_dir / "Content"
         content_dir.mkdir(parents=True, exist_ok=True)
-        copy_daz_root(daz_root, content_dir, include_promos)
+        copy_daz_root(daz_root, content_dir, include_promos, move=not keep_temp)
         print(f"✅ Merged {archive_path.name} → {content_dir}")
     else:
-        cleaned_dir = output_dir / (archive_path.stem + "_normalized")
-        cleaned_dir.mkdir(parents=True, exist_ok=True)
-        copy_daz_root(daz_root, cleaned_dir, include_promos)
-        zip_path = shutil.make_archive(str(cleaned_dir), "zip", cleaned_dir)
-        print(f"✅ Normalized: {archive_path.name} → {Path(zip_path).name}")
+        if daz_root != cleaned_dir:
+            cleaned_dir.mkdir(parents=True, exist_ok=True)
+            copy_daz_root(daz_root, cleaned_dir, include_promos, move=not keep_temp)
+        zip_path = cleaned_dir.with_name(cleaned_dir.name + ".zip")
+        if compress:
+            parallel_zip(cleaned_dir, zip_path, zip_workers)
+        else:
+            make_zip_stored(cleaned_dir, zip_path)
+        print(f"✅ Normalized: {archive_path.name} → {zip_path.name}")
 
     if not keep_temp:
-        shutil.rmtree(tempdir, ignore_errors=True)
+        remove_work_dir(tempdir)
 
-    tempdir = Path(tempfile.mkdtemp())
-
-    print(f"📦 Extracting {archive_path.name}...")
-    extract_archive(archive_path, tempdir)
-
-    # Fully unpack all nested archives (repeat until none left)
-    extract_all_archives_recursively(tempdir)
-
-    # Now find the DAZ root
-    daz_root = find_daz_root(tempdir)
-    print(f"🧭 Detected DAZ root: {daz_root}" if daz_root else "🧭 No DAZ root detected.")
-
-    if not daz_root:
-        # Try again one level deeper, sometimes content is inside a single extracted folder
-        subfolders = [f for f in tempdir.iterdir() if f.is_dir()]
-        for sub in subfolders:
-            daz_root = find_daz_root(sub)
-            if daz_root:
-                break
-
-    if not daz_root:
-        print(f"⚠️ No DAZ folder found in {archive_path.name}")
-        if not keep_temp:
-            shutil.rmtree(tempdir, ignore_errors=True)
-        return
-
-    if merge_into_content:
-        # Merge all directly into output_dir/Content
-        content_dir = output_dir / "Content"
-        content_dir.mkdir(parents=True, exist_ok=True)
-        copy_daz_root(daz_root, content_dir, include_promos)
-        print(f"✅ Merged {archive_path.name} → {content_dir}")
-    else:
-        cleaned_dir = output_dir / (archive_path.stem + "_normalized")
-        cleaned_dir.mkdir(parents=True, exist_ok=True)
-        copy_daz_root(daz_root, cleaned_dir, include_promos)
-        zip_path = shutil.make_archive(str(cleaned_dir), "zip", cleaned_dir)
-        print(f"✅ Normalized: {archive_path.name} → {Path(zip_path).name}")
-
-    if not keep_temp:
-        shutil.rmtree(tempdir, ignore_errors=True)
+def process_archive(archive_path: Path, output_dir: Path, include_promos: bool, keep_temp: bool, merge_into_content: bool, temp_root: Path | None = None, native_extractors: bool = False, compress: bool = False, zip_workers: int | None = None) -> tuple[Path, Path] | None:
+    """
+    Worker pool entry point: stage the archive and, unless merging, finish
+    it right away so normalized zips are written in parallel.
+    Returns (tempdir, daz_root) when the merge is left to the main process.
+    """
+    staged = stage_archive(archive_path, output_dir, include_promos, keep_temp, merge_into_content, temp_root, native_extractors)
+    if staged and not merge_into_content:
+        finish_archive(archive_path, *staged, output_dir, include_promos, keep_temp, merge_into_content, compress, zip_workers)
+        return None
+    return staged
 
 # -------------------------
 # CLI Entry Point
@@ -253,24 +771,89 @@ def main():
         action="store_true",
         help="Merge all normalized content into one 'Content' folder suitable for direct DAZ installation"
     )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Deflate normalized zips (on all CPU cores) instead of storing files uncompressed"
+    )
+    parser.add_argument(
+        "--native-extractors",
+        action="store_true",
+        help="Extract large .7z/.rar archives with the 7z/unrar programs when installed (multi-threaded)"
+    )
+    parser.add_argument(
+        "--temp-dir",
+        type=Path,
+        default=None,
+        help="Where to create temporary extraction folders (default: inside output_dir, "
+             "so results can be moved instead of copied)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of archives to process in parallel (default: number of CPUs)"
+    )
 
     args = parser.parse_args()
 
     args.output_dir.mkdir(parents=True, exist_ok=True)
-    archives = [f for f in args.input_dir.iterdir() if f.is_file() and f.suffix.lower() in ARCHIVE_EXTS]
+    archives = [f for f in args.input_dir.iterdir() if f.is_file() and _has_ext(_ARCHIVE_RE, f.name)]
 
     if not archives:
         print("⚠️ No archives found in input directory.")
         return
 
-    for archive in archives:
-        process_archive(
-            archive,
-            args.output_dir,
-            include_promos=args.include_promos,
-            keep_temp=args.keep_temp,
-            merge_into_content=args.merge_into_content
-        )
+    # All of this run's work dirs go in one folder of its own, so cleaning up
+    # after an interrupted run never touches another run's (or --keep-temp) dirs
+    (args.temp_dir or args.output_dir).mkdir(parents=True, exist_ok=True)
+    temp_root = Path(tempfile.mkdtemp(dir=args.temp_dir or args.output_dir, prefix=WORK_DIR_PREFIX))
+    if not args.keep_temp:
+        atexit.register(shutil.rmtree, temp_root, ignore_errors=True)
+
+    options = dict(
+        output_dir=args.output_dir,
+        include_promos=args.include_promos,
+        keep_temp=args.keep_temp,
+        merge_into_content=args.merge_into_content
+    )
+    workers = max(1, min(args.jobs, len(archives)))
+    # Every worker process zips with its own thread pool; split the cores
+    # between them instead of giving each one all of them
+    zip_workers = max(1, (os.cpu_count() or 1) // workers)
+
+    # Pipeline: the pool extracts (and, without merging, zips) archives in
+    # parallel while this thread merges the ones already extracted. At most
+    # workers + PIPELINE_DEPTH archives are in flight, so while a merge runs
+    # up to workers + PIPELINE_DEPTH - 1 extracted archives wait on disk.
+    todo = deque(archives)
+    in_flight = deque()  # (archive, future), in submission order
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=({_ext(a.name) for a in archives},)
+    ) as executor:
+        while todo or in_flight:
+            while todo and len(in_flight) < workers + PIPELINE_DEPTH:
+                archive = todo.popleft()
+                future = executor.submit(
+                    process_archive, archive,
+                    temp_root=temp_root, native_extractors=args.native_extractors,
+                    compress=args.compress, zip_workers=zip_workers, **options
+                )
+                in_flight.append((archive, future))
+            if args.merge_into_content:
+                # Merge in input order, not completion order, so that when two
+                # archives ship the same file the same copy always wins
+                archive, future = in_flight.popleft()
+                staged = future.result()
+                if staged:
+                    finish_archive(archive, *staged, **options)
+            else:
+                done, _ = wait([future for _, future in in_flight], return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+                in_flight = deque(item for item in in_flight if item[1] not in done)
 
     print("\n✅ All done!")
 